@@ -1,97 +1,133 @@
 #!/usr/bin/env python3
 import os
+from functools import lru_cache
 from PIL import Image, ImageDraw
 import math
 
-def create_icon(size):
-    # Create a new image with transparent background
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
-    # Create purple gradient background similar to the reference image
-    for y in range(size):
-        ratio = y / size
-        # Purple gradient: darker purple to lighter purple
-        r = int(76 * (1 - ratio) + 110 * ratio)   # 76->110
-        g = int(84 * (1 - ratio) + 115 * ratio)   # 84->115
-        b = int(200 * (1 - ratio) + 230 * ratio)  # 200->230
-        color = (r, g, b, 255)
-        draw.line([(0, y), (size, y)], fill=color)
-    
-    # Add rounded rectangle mask - modern iOS style
-    mask = Image.new('L', (size, size), 0)
-    mask_draw = ImageDraw.Draw(mask)
-    corner_radius = size // 8  # iOS-style corner radius
-    mask_draw.rounded_rectangle([0, 0, size, size], radius=corner_radius, fill=255)
-    
-    # Apply mask
-    img.putalpha(mask)
-    
-    # Draw feather (quill pen) - main element
+# sin(progress * pi) at the evenly spaced vane points: 8 along the app icon
+# feather (progress = i / 7) and 6 along the menu bar one (progress = i / 5).
+# The values are fixed-point integers, so a vane offset of `tenths`/10 of the
+# feather width is `width * tenths * SIN8[i] // SIN_TENTHS`, which truncates
+# exactly like the float product for every size up to 4096px
+SIN_SHIFT = 24
+SIN_TENTHS = 10 << SIN_SHIFT
+SIN8 = tuple(round(math.sin(i / 7.0 * math.pi) * (1 << SIN_SHIFT)) for i in range(8))
+SIN6 = tuple(round(math.sin(i / 5.0 * math.pi) * (1 << SIN_SHIFT)) for i in range(6))
+
+def _gradient_channel(rows, start, end):
+    """One color channel of the background gradient for a column of row indices"""
+    size = rows.height
+    return rows.point(lambda y: y * ((end - start) / size) + start).convert('L')
+
+def _round_corners(img, radius):
+    """Cut rounded corners into img's alpha channel, touching only the corner tiles"""
+    if not radius:
+        return
+    # PIL's rounded corners don't depend on the rectangle size, so draw a
+    # small rectangle whose four corner tiles are the full mask's corners
+    tile = radius + 1
+    corners = Image.new('L', (2 * tile, 2 * tile), 0)
+    ImageDraw.Draw(corners).rounded_rectangle([0, 0, 2 * tile, 2 * tile], radius=radius, fill=255)
+    for x, y in ((0, 0), (tile, 0), (0, tile), (tile, tile)):
+        left, top = x and img.width - tile, y and img.height - tile
+        corner = img.crop((left, top, left + tile, top + tile))
+        corner.putalpha(corners.crop((x, y, x + tile, y + tile)))
+        img.paste(corner, (left, top))
+
+@lru_cache(maxsize=None)
+def _build_feather(size, height_divisor, sin_table, left_tenths, right_tenths):
+    """Shaft endpoints and vane outline of the feather drawn on both icons.
+
+    The vane has one point per sin_table entry on each side; the outline runs
+    down the left side and back up the right one. Results are cached because
+    the same size is rendered more than once (e.g. 32px and 16px@2x).
+    """
     center_x, center_y = size // 2, size // 2
-    feather_height = size // 1.8  # Make it prominent
+    feather_height = int(size // height_divisor)
     feather_width = feather_height // 3
+    left_vane_width = feather_width * left_tenths
+    right_vane_width = feather_width * right_tenths
     
     # Feather positioning - slightly to the left and rotated
     feather_x = center_x - size // 8
     feather_y = center_y
     
-    # Draw feather shaft (main stem)
-    shaft_start_x = feather_x
-    shaft_start_y = feather_y + feather_height // 2
-    shaft_end_x = feather_x + feather_height // 8
-    shaft_end_y = feather_y - feather_height // 2
+    # Feather shaft (main stem), bottom to top
+    shaft = ((feather_x, feather_y + feather_height // 2),
+             (feather_x + feather_height // 8, feather_y - feather_height // 2))
     
-    shaft_width = max(2, size // 40)
-    draw.line([(shaft_start_x, shaft_start_y), (shaft_end_x, shaft_end_y)], 
-              fill=(255, 255, 255, 255), width=shaft_width)
-    
-    # Draw feather vane (the fluffy part) - left side
+    # Feather vane (the fluffy part): curved left side, smaller right side
+    last = len(sin_table) - 1
     vane_points_left = []
-    for i in range(8):  # Number of points on left side
-        progress = i / 7.0
-        offset_y = feather_y - feather_height // 2 + (feather_height * progress)
-        
-        # Create curved outline for left side of feather
-        curve_offset = int(feather_width * math.sin(progress * math.pi) * 0.7)
-        point_x = feather_x - curve_offset
-        point_y = offset_y
-        vane_points_left.append((point_x, point_y))
-    
-    # Draw feather vane (the fluffy part) - right side
     vane_points_right = []
-    for i in range(8):  # Number of points on right side
-        progress = i / 7.0
-        offset_y = feather_y - feather_height // 2 + (feather_height * progress)
-        
-        # Create curved outline for right side of feather (smaller)
-        curve_offset = int(feather_width * math.sin(progress * math.pi) * 0.4)
-        point_x = feather_x + curve_offset + feather_height // 12
-        point_y = offset_y
-        vane_points_right.append((point_x, point_y))
+    for i, sin in enumerate(sin_table):
+        offset_y = feather_y - feather_height // 2 + (feather_height * (i / last))
+        vane_points_left.append((feather_x - left_vane_width * sin // SIN_TENTHS, offset_y))
+        vane_points_right.append((feather_x + right_vane_width * sin // SIN_TENTHS + feather_height // 12, offset_y))
+    
+    return shaft, tuple(vane_points_left + vane_points_right[::-1])
+
+def create_icon(size):
+    # Create purple gradient background similar to the reference image.
+    # Every row is a single color: map a 1px wide column of row indices
+    # through each channel's ramp with Image.point, then stretch the merged
+    # column across the icon in one resize
+    rows = Image.new('I', (1, size))
+    rows.putdata(range(size))
+    column = Image.merge('RGBA', (
+        # Purple gradient: darker purple to lighter purple
+        _gradient_channel(rows, 76, 110),   # 76->110
+        _gradient_channel(rows, 84, 115),   # 84->115
+        _gradient_channel(rows, 200, 230),  # 200->230
+        Image.new('L', (1, size), 255),
+    ))
+    img = column.resize((size, size), Image.NEAREST)
+    draw = ImageDraw.Draw(img)
+    
+    # Add rounded rectangle mask - modern iOS style
+    # The gradient is already opaque, so only the corners need new alpha
+    corner_radius = size // 8  # iOS-style corner radius
+    _round_corners(img, corner_radius)
+    
+    # Draw feather (quill pen) - main element
+    shaft, feather_points = _build_feather(size, 1.8, SIN8, 7, 4)
     
-    # Create complete feather outline
-    feather_points = vane_points_left + list(reversed(vane_points_right))
+    shaft_width = max(2, size // 40)
+    draw.line(shaft, fill=(255, 255, 255, 255), width=shaft_width)
     
     # Draw filled feather
     draw.polygon(feather_points, fill=(255, 255, 255, 255))
     
-    # Add feather details (barbs)
+    # Barbs and dots are placed relative to the same feather geometry
+    center_x, center_y = size // 2, size // 2
+    feather_height = int(size // 1.8)  # Make it prominent
+    feather_width = feather_height // 3
+    left_barb_width = feather_width * 5
+    right_barb_width = feather_width * 3
+    feather_x = center_x - size // 8
+    feather_y = center_y
+    
+    # Add feather details (barbs). These stay draw.line calls so the barb
+    # rows are placed exactly as PIL rounds the float detail_y
+    barb_top = feather_y - feather_height // 2
+    barb_fill = (76, 84, 200, 180)
+    barb_width = max(1, size // 80)
+    left_start_x = feather_x
+    right_start_x = feather_x + feather_height // 24
+    right_end_base = feather_x + feather_height // 12
     for i in range(1, 7):
         progress = i / 7.0
-        detail_y = feather_y - feather_height // 2 + (feather_height * progress * 0.8)
+        detail_y = barb_top + (feather_height * progress * 0.8)
         
         # Left side barbs
-        left_start_x = feather_x
-        left_end_x = feather_x - int(feather_width * math.sin(progress * math.pi) * 0.5)
+        left_end_x = feather_x - left_barb_width * SIN8[i] // SIN_TENTHS
         draw.line([(left_start_x, detail_y), (left_end_x, detail_y)], 
-                  fill=(76, 84, 200, 180), width=max(1, size // 80))
+                  fill=barb_fill, width=barb_width)
         
         # Right side barbs (shorter)
-        right_start_x = feather_x + feather_height // 24
-        right_end_x = feather_x + int(feather_width * math.sin(progress * math.pi) * 0.3) + feather_height // 12
+        right_end_x = right_end_base + right_barb_width * SIN8[i] // SIN_TENTHS
         draw.line([(right_start_x, detail_y), (right_end_x, detail_y)], 
-                  fill=(76, 84, 200, 180), width=max(1, size // 80))
+                  fill=barb_fill, width=barb_width)
     
     # Draw small decorative dots (magic particles) on the right side
     dot_positions = [
@@ -133,41 +169,13 @@ def create_menu_bar_icon(size):
     draw = ImageDraw.Draw(img)
     
     center_x, center_y = size // 2, size // 2
-    feather_height = size // 1.6
-    feather_width = feather_height // 3
-    
-    # Simple feather outline for menu bar
-    feather_x = center_x - size // 8
-    feather_y = center_y
+    shaft, vane_points = _build_feather(size, 1.6, SIN6, 6, 3)
     
     # Feather shaft
-    shaft_start_x = feather_x
-    shaft_start_y = feather_y + feather_height // 2
-    shaft_end_x = feather_x + feather_height // 8
-    shaft_end_y = feather_y - feather_height // 2
-    
     shaft_width = max(1, size // 12)
-    draw.line([(shaft_start_x, shaft_start_y), (shaft_end_x, shaft_end_y)], 
-              fill=(255, 255, 255, 255), width=shaft_width)
+    draw.line(shaft, fill=(255, 255, 255, 255), width=shaft_width)
     
     # Simplified feather vane
-    vane_points = []
-    for i in range(6):
-        progress = i / 5.0
-        offset_y = feather_y - feather_height // 2 + (feather_height * progress)
-        
-        # Left side
-        left_x = feather_x - int(feather_width * math.sin(progress * math.pi) * 0.6)
-        vane_points.append((left_x, offset_y))
-    
-    # Right side
-    for i in range(6):
-        progress = (5-i) / 5.0
-        offset_y = feather_y - feather_height // 2 + (feather_height * progress)
-        
-        right_x = feather_x + int(feather_width * math.sin(progress * math.pi) * 0.3) + feather_height // 12
-        vane_points.append((right_x, offset_y))
-    
     draw.polygon(vane_points, fill=(255, 255, 255, 255))
     
     # Small dots for menu bar
@@ -193,7 +201,10 @@ print(f"Creating icons in: {icon_dir}")
 # Ensure directory exists
 os.makedirs(icon_dir, exist_ok=True)
 
-# Create standard app icons
+# Create standard app icons. Each size is rendered directly rather than
+# downsampled from a large master: that is cheaper here and keeps the
+# small-size minimums (shaft, barb and dot widths) crisp. The renders run
+# serially because starting worker processes costs more than all of them
 for size in sizes:
     print(f"Creating icon {size}x{size}...")
     icon = create_icon(size)